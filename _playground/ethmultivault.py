@@ -1,77 +1,84 @@
-from decimal import *
+from decimal import Decimal
 from web3 import Web3
-import math
+import io
+import sys
 
 
 ## ------------ Parameters ------------
 
 # Atom
-atomCreationProtocolFee = Web3.to_wei(Decimal('0.0002'), 'ether')
-atomWalletInitialDepositAmount = Web3.to_wei(Decimal('0.0001'), 'ether')
+atomCreationProtocolFee = int(Web3.to_wei(Decimal('0.0002'), 'ether'))
+atomWalletInitialDepositAmount = int(Web3.to_wei(Decimal('0.0001'), 'ether'))
 
 # Triple
-tripleCreationProtocolFee = Web3.to_wei(Decimal('0.0002'), 'ether')
-totalAtomDepositsOnTripleCreation = Web3.to_wei(Decimal('0.0003'), 'ether')
+tripleCreationProtocolFee = int(Web3.to_wei(Decimal('0.0002'), 'ether'))
+totalAtomDepositsOnTripleCreation = int(Web3.to_wei(Decimal('0.0003'), 'ether'))
 totalAtomDepositsForTriple = 1500 # 15%
 
 # General
-minShare = Web3.to_wei(Decimal('0.0000000000001'), 'ether')
+minShare = int(Web3.to_wei(Decimal('0.0000000000001'), 'ether'))
 protocolFee = 100 # 1%
 entryFee = 500 # 5%
 exitFee = 500 # 5%
 feeDenominator = 10000
 
 # Costs
-atomCost = Decimal(atomCreationProtocolFee) + Decimal(atomWalletInitialDepositAmount) + Decimal(minShare)
-tripleCost = Decimal(tripleCreationProtocolFee) + Decimal(totalAtomDepositsOnTripleCreation) + Decimal(2) * Decimal(minShare)
+atomCost = atomCreationProtocolFee + atomWalletInitialDepositAmount + minShare
+tripleCost = tripleCreationProtocolFee + totalAtomDepositsOnTripleCreation + 2 * minShare
+
+# Derived
+atomDepositOnTripleCreationPerAtom = totalAtomDepositsOnTripleCreation // 3
 
 
 ## ------------ Functions ------------
 
-def createAtom(value: Decimal) -> tuple[Decimal, Decimal, Decimal, Decimal, Decimal]:
+# All amounts are integer wei, mirroring the contract's uint256 math:
+# ceil(a * b / d) is (a * b + d - 1) // d and floor(a * b / d) is a * b // d
+
+def createAtom(value: int) -> tuple[int, int, int, int, int]:
   # Variables
   userDeposit = value - atomCost
-  protocolFeeAmount = math.ceil(userDeposit * Decimal(protocolFee) / Decimal(feeDenominator))
-  userDepositAfterprotocolFee = userDeposit - Decimal(protocolFeeAmount)
+  protocolFeeAmount = (userDeposit * protocolFee + feeDenominator - 1) // feeDenominator
+  userDepositAfterprotocolFee = userDeposit - protocolFeeAmount
 
   # Atom vault
   userShares = userDepositAfterprotocolFee
-  totalShares = userDepositAfterprotocolFee + Decimal(atomWalletInitialDepositAmount) + Decimal(minShare)
+  totalShares = userDepositAfterprotocolFee + atomWalletInitialDepositAmount + minShare
   totalAssets = totalShares
 
   # Addresses
-  atomWalletShares = Decimal(atomWalletInitialDepositAmount)
-  protocolMultisigAssets = Decimal(atomCreationProtocolFee) + Decimal(protocolFeeAmount)
+  atomWalletShares = atomWalletInitialDepositAmount
+  protocolMultisigAssets = atomCreationProtocolFee + protocolFeeAmount
 
   return (userShares, totalShares, totalAssets, atomWalletShares, protocolMultisigAssets)
 
 
-def createTriple(value: Decimal) -> tuple[Decimal, Decimal, Decimal, Decimal, Decimal, Decimal, Decimal, Decimal, Decimal]:
+def createTriple(value: int) -> tuple[int, int, int, int, int, int, int, int, int]:
   # Variables
   userDeposit = value - tripleCost
-  protocolFeeAmount = math.ceil(userDeposit * Decimal(protocolFee) / Decimal(feeDenominator))
-  userDepositAfterprotocolFee = userDeposit - Decimal(protocolFeeAmount)
-  atomDeposits = math.floor(userDepositAfterprotocolFee * Decimal(totalAtomDepositsForTriple) / Decimal(feeDenominator))
-  perAtom = math.floor(atomDeposits / Decimal(3))
+  protocolFeeAmount = (userDeposit * protocolFee + feeDenominator - 1) // feeDenominator
+  userDepositAfterprotocolFee = userDeposit - protocolFeeAmount
+  atomDeposits = userDepositAfterprotocolFee * totalAtomDepositsForTriple // feeDenominator
+  perAtom = atomDeposits // 3
   userAssetsAfterAtomDepositFraction = userDepositAfterprotocolFee - atomDeposits
-  entryFeeAmount = math.floor(perAtom * Decimal(entryFee) / Decimal(feeDenominator))
+  entryFeeAmount = perAtom * entryFee // feeDenominator
   assetsForTheAtom = perAtom - entryFeeAmount
   userSharesAfterTotalFees = assetsForTheAtom # assuming current price = 1 ether
 
   # Triple vaults
   userSharesPositiveVault = userAssetsAfterAtomDepositFraction
-  totalSharesPositiveVault = userAssetsAfterAtomDepositFraction + Decimal(minShare)
+  totalSharesPositiveVault = userAssetsAfterAtomDepositFraction + minShare
   totalAssetsPositiveVault = totalSharesPositiveVault
-  totalSharesNegativeVault = Decimal(minShare)
-  totalAssetsNegativeVault = Decimal(minShare)
+  totalSharesNegativeVault = minShare
+  totalAssetsNegativeVault = minShare
 
   # Underlying atom's vaults
   userSharesAtomVault = userSharesAfterTotalFees
-  totalAssetsAtomVault = assetsForTheAtom + entryFeeAmount + math.floor(Decimal(totalAtomDepositsOnTripleCreation) / Decimal(3))
+  totalAssetsAtomVault = assetsForTheAtom + entryFeeAmount + atomDepositOnTripleCreationPerAtom
   totalSharesAtomVault = userSharesAfterTotalFees
 
   # Addresses
-  protocolMultisigAssets = Decimal(tripleCreationProtocolFee) + Decimal(protocolFeeAmount)
+  protocolMultisigAssets = tripleCreationProtocolFee + protocolFeeAmount
 
   return (userSharesPositiveVault,
           totalSharesPositiveVault,
@@ -84,13 +91,13 @@ def createTriple(value: Decimal) -> tuple[Decimal, Decimal, Decimal, Decimal, De
           protocolMultisigAssets)
 
 
-def depositAtom(value: Decimal, totalAssets: Decimal, totalShares: Decimal) -> tuple[Decimal, Decimal, Decimal, Decimal]:
+def depositAtom(value: int, totalAssets: int, totalShares: int) -> tuple[int, int, int, int]:
   # Variables
-  protocolFeeAmount = math.ceil(value * Decimal(protocolFee) / Decimal(feeDenominator))
-  userDepositAfterprotocolFee = value - Decimal(protocolFeeAmount)
-  entryFeeAmount = math.floor(userDepositAfterprotocolFee * Decimal(entryFee) / Decimal(feeDenominator))
+  protocolFeeAmount = (value * protocolFee + feeDenominator - 1) // feeDenominator
+  userDepositAfterprotocolFee = value - protocolFeeAmount
+  entryFeeAmount = userDepositAfterprotocolFee * entryFee // feeDenominator
   assetsForTheAtom = userDepositAfterprotocolFee - entryFeeAmount
-  userSharesForTheAtom = math.floor((assetsForTheAtom * totalShares) / totalAssets)
+  userSharesForTheAtom = (assetsForTheAtom * totalShares) // totalAssets
 
   # Atom vault
   totalAssetsAtomVault = totalAssets + assetsForTheAtom + entryFeeAmount
@@ -102,38 +109,38 @@ def depositAtom(value: Decimal, totalAssets: Decimal, totalShares: Decimal) -> t
   return (userSharesForTheAtom, totalSharesAtomVault, totalAssetsAtomVault, protocolMultisigAssets)
 
 
-def depositTriple(value: Decimal, totalAssets: Decimal, totalShares: Decimal, totalAssetsAtom: Decimal, totalSharesAtom: Decimal) -> tuple[Decimal, Decimal, Decimal, Decimal, Decimal, Decimal, Decimal]:
+def depositTriple(value: int, totalAssets: int, totalShares: int, totalAssetsAtom: int, totalSharesAtom: int) -> tuple[int, int, int, int, int, int, int]:
   # Variables for triple
-  protocolFeeAmount = math.ceil(value * Decimal(protocolFee) / Decimal(feeDenominator))
-  userDepositAfterprotocolFee = value - Decimal(protocolFeeAmount)
-  atomDeposits = math.floor(userDepositAfterprotocolFee * Decimal(totalAtomDepositsForTriple) / Decimal(feeDenominator))
+  protocolFeeAmount = (value * protocolFee + feeDenominator - 1) // feeDenominator
+  userDepositAfterprotocolFee = value - protocolFeeAmount
+  atomDeposits = userDepositAfterprotocolFee * totalAtomDepositsForTriple // feeDenominator
   userAssetsAfterAtomDepositFraction = userDepositAfterprotocolFee - atomDeposits
   if (totalShares == minShare):
     entryFeeAmount = 0
   else:
-    entryFeeAmount = math.floor(userAssetsAfterAtomDepositFraction * Decimal(entryFee) / Decimal(feeDenominator))
+    entryFeeAmount = userAssetsAfterAtomDepositFraction * entryFee // feeDenominator
   assetsAfterEntryFee = userAssetsAfterAtomDepositFraction - entryFeeAmount
   if (totalShares == 0):
     userSharesAfterEntryFee = assetsAfterEntryFee
   else:
-    userSharesAfterEntryFee = math.floor((assetsAfterEntryFee * totalShares) / totalAssets)
+    userSharesAfterEntryFee = (assetsAfterEntryFee * totalShares) // totalAssets
 
   # Triple vaults
   userSharesPositiveVault = userSharesAfterEntryFee
-  totalAssetsPositiveVault = assetsAfterEntryFee + Decimal(entryFeeAmount)
+  totalAssetsPositiveVault = assetsAfterEntryFee + entryFeeAmount
   totalSharesPositiveVault = userSharesAfterEntryFee
 
   # Variables for atom
-  perAtom = math.floor(atomDeposits / Decimal(3))
+  perAtom = atomDeposits // 3
   if (totalSharesAtom == minShare):
     entryFeeAmountForAtom = 0
   else:
-    entryFeeAmountForAtom = math.floor(perAtom * Decimal(entryFee) / Decimal(feeDenominator))
+    entryFeeAmountForAtom = perAtom * entryFee // feeDenominator
   assetsForTheAtom = perAtom - entryFeeAmountForAtom
   if (totalSharesAtom == 0):
     userSharesForTheAtom = assetsForTheAtom
   else:  
-    userSharesForTheAtom = math.floor((assetsForTheAtom * totalSharesAtom) / totalAssetsAtom)
+    userSharesForTheAtom = (assetsForTheAtom * totalSharesAtom) // totalAssetsAtom
 
   # Underlying atom's vaults
   userSharesAtomVault = userSharesForTheAtom
@@ -141,7 +148,7 @@ def depositTriple(value: Decimal, totalAssets: Decimal, totalShares: Decimal, to
   totalSharesAtomVault = userSharesForTheAtom
 
   # Addresses
-  protocolMultisigAssets = Decimal(protocolFeeAmount)
+  protocolMultisigAssets = protocolFeeAmount
 
   return (userSharesPositiveVault,
           totalSharesPositiveVault,
@@ -152,120 +159,103 @@ def depositTriple(value: Decimal, totalAssets: Decimal, totalShares: Decimal, to
           protocolMultisigAssets)
 
 
-def redeem(shares: Decimal, totalAssets: Decimal, totalShares: Decimal):
+def redeem(shares: int, totalAssets: int, totalShares: int) -> tuple[int, int, int]:
   if (totalShares == 0):
     userAssets = shares
   else:
-    userAssets = math.floor((shares * totalAssets) / totalShares)
+    userAssets = (shares * totalAssets) // totalShares
 
-  protocolFeeAmount = math.ceil(Decimal(userAssets) * Decimal(protocolFee) / Decimal(feeDenominator))
-  userAssetsAfterprotocolFee = Decimal(userAssets) - Decimal(protocolFeeAmount)
+  protocolFeeAmount = (userAssets * protocolFee + feeDenominator - 1) // feeDenominator
+  userAssetsAfterprotocolFee = userAssets - protocolFeeAmount
 
   if (totalShares - shares == minShare):
     exitFeeAmount = 0
   else:
-    exitFeeAmount = math.ceil(userAssetsAfterprotocolFee * Decimal(exitFee) / Decimal(feeDenominator))
+    exitFeeAmount = (userAssetsAfterprotocolFee * exitFee + feeDenominator - 1) // feeDenominator
 
-  userAssetsAfterexitFee = userAssetsAfterprotocolFee - Decimal(exitFeeAmount)
+  userAssetsAfterexitFee = userAssetsAfterprotocolFee - exitFeeAmount
   
   return (userAssetsAfterexitFee, protocolFeeAmount, exitFeeAmount)
 
 
+## ------------ Test values ------------
+
+etherTestValues = tuple(int(Web3.to_wei(amount, 'ether')) for amount in (1, 10, 100, 1000))
+testValuesAtom = (atomCost, atomCost + 1) + etherTestValues
+testValuesTriple = (tripleCost, tripleCost + 1) + etherTestValues
+
+
+## ------------ Output templates ------------
+
+atomTemplate = "UseCaseAtom({{ value: {value}, userShares: {userShares}, atomWalletShares: {atomWalletShares}, " \
+  "totalShares: {totalShares}, totalAssets: {totalAssets}, protocolMultisigAssets: {protocolMultisigAssets} }})"
+
+atomPushTemplate = "useCaseAtoms.push(" + atomTemplate + ");"
+
+triplePushTemplate = "useCaseTriples.push(UseCaseTriple({{ value: {value}, userShares: {userShares}, " \
+  "totalSharesPos: {totalSharesPos}, totalAssetsPos: {totalAssetsPos}, totalSharesNeg: {totalSharesNeg}, " \
+  "totalAssetsNeg: {totalAssetsNeg}, protocolMultisigAssets: {protocolMultisigAssets}, " \
+  "subject:{subject}, predicate:{predicate}, obj:{obj} }}));"
+
+redeemPushTemplate = "useCaseRedeems.push(UseCaseRedeem({{ value: {value}, shares: {shares}, assets: {assets}, " \
+  "totalRemainingShares: {totalRemainingShares}, totalRemainingAssets: {totalRemainingAssets}, " \
+  "protocolMultisigAssets: {protocolMultisigAssets} }}));"
+
+
+## ------------ Output ------------
+
+# Lines are buffered in memory and written with a single call at the end
+out = io.StringIO()
+
+
 ## ------------ Create Atom data ------------
 
-print()
-print("Create atom data")
-
-for value in [
-    atomCost,
-    Decimal(atomCost) + Decimal(1),
-    Web3.to_wei(Decimal('1'), 'ether'),
-    Web3.to_wei(Decimal('10'), 'ether'),
-    Web3.to_wei(Decimal('100'), 'ether'),
-    Web3.to_wei(Decimal('1000'), 'ether'),
-]:
+print(file=out)
+print("Create atom data", file=out)
+
+for value in testValuesAtom:
   (userShares, totalShares, totalAssets, atomWalletShares, protocolMultisigAssets) = createAtom(value)
 
-  print(f"useCaseAtoms.push(UseCaseAtom({{ \
-    value: {value}, \
-    userShares: {userShares}, \
-    atomWalletShares: {atomWalletShares}, \
-    totalShares: {totalShares}, \
-    totalAssets: {totalAssets}, \
-    protocolMultisigAssets: {protocolMultisigAssets} \
-  }}));".replace("  ", ''))
+  print(atomPushTemplate.format(value=value, userShares=userShares, atomWalletShares=atomWalletShares,
+    totalShares=totalShares, totalAssets=totalAssets, protocolMultisigAssets=protocolMultisigAssets), file=out)
 
 
 ## ------------ Create Triple data ------------
 
-print()
-print("Create triple data")
-
-for value in [
-    tripleCost,
-    Decimal(tripleCost) + Decimal(1),
-    Web3.to_wei(Decimal('1'), 'ether'),
-    Web3.to_wei(Decimal('10'), 'ether'),
-    Web3.to_wei(Decimal('100'), 'ether'),
-    Web3.to_wei(Decimal('1000'), 'ether'),
-]:
+print(file=out)
+print("Create triple data", file=out)
+
+for value in testValuesTriple:
   # Create atoms
   (userShares0, totalShares0, totalAssets0, atomWalletShares0, protocolMultisigAssets0) = createAtom(value)
-  (userShares1, totalShares1, totalAssets1, atomWalletShares1, protocolMultisigAssets1) = createAtom(value + Decimal(1))
-  (userShares2, totalShares2, totalAssets2, atomWalletShares2, protocolMultisigAssets2) = createAtom(value + Decimal(2))
+  (userShares1, totalShares1, totalAssets1, atomWalletShares1, protocolMultisigAssets1) = createAtom(value + 1)
+  (userShares2, totalShares2, totalAssets2, atomWalletShares2, protocolMultisigAssets2) = createAtom(value + 2)
 
   # Create triple
   (userSharesPositiveVault, totalSharesPositiveVault, totalAssetsPositiveVault, totalSharesNegativeVault,
     totalAssetsNegativeVault, userSharesAtomVault, totalSharesAtomVault, totalAssetsAtomVault, protocolMultisigAssets) = createTriple(value)
 
-  print(f"useCaseTriples.push(UseCaseTriple({{ \
-    value: {value}, \
-    userShares: {userSharesPositiveVault}, \
-    totalSharesPos: {totalSharesPositiveVault}, \
-    totalAssetsPos: {totalAssetsPositiveVault}, \
-    totalSharesNeg: {totalSharesNegativeVault}, \
-    totalAssetsNeg: {totalAssetsNegativeVault}, \
-    protocolMultisigAssets: {protocolMultisigAssets0 + protocolMultisigAssets1 + protocolMultisigAssets2 + protocolMultisigAssets}, \
-    subject:UseCaseAtom({{ \
-      value: {value}, \
-      userShares: {userShares0 + userSharesAtomVault}, \
-      atomWalletShares: {atomWalletShares0}, \
-      totalShares: {totalShares0 + totalSharesAtomVault}, \
-      totalAssets: {totalAssets0 + totalAssetsAtomVault}, \
-      protocolMultisigAssets: {protocolMultisigAssets0} \
-    }}), \
-    predicate:UseCaseAtom({{ \
-      value: {value + Decimal(1)}, \
-      userShares: {userShares1 + userSharesAtomVault}, \
-      atomWalletShares: {atomWalletShares1}, \
-      totalShares: {totalShares1 + totalSharesAtomVault}, \
-      totalAssets: {totalAssets1 + totalAssetsAtomVault}, \
-      protocolMultisigAssets: {protocolMultisigAssets1} \
-    }}), \
-    obj:UseCaseAtom({{ \
-      value: {value + Decimal(2)}, \
-      userShares: {userShares2 + userSharesAtomVault}, \
-      atomWalletShares: {atomWalletShares2}, \
-      totalShares: {totalShares2 + totalSharesAtomVault}, \
-      totalAssets: {totalAssets2 + totalAssetsAtomVault}, \
-      protocolMultisigAssets: {protocolMultisigAssets2} \
-    }}) \
-  }}));".replace("  ", ''))
+  print(triplePushTemplate.format(value=value, userShares=userSharesPositiveVault,
+    totalSharesPos=totalSharesPositiveVault, totalAssetsPos=totalAssetsPositiveVault,
+    totalSharesNeg=totalSharesNegativeVault, totalAssetsNeg=totalAssetsNegativeVault,
+    protocolMultisigAssets=protocolMultisigAssets0 + protocolMultisigAssets1 + protocolMultisigAssets2 + protocolMultisigAssets,
+    subject=atomTemplate.format(value=value, userShares=userShares0 + userSharesAtomVault, atomWalletShares=atomWalletShares0,
+      totalShares=totalShares0 + totalSharesAtomVault, totalAssets=totalAssets0 + totalAssetsAtomVault,
+      protocolMultisigAssets=protocolMultisigAssets0),
+    predicate=atomTemplate.format(value=value + 1, userShares=userShares1 + userSharesAtomVault, atomWalletShares=atomWalletShares1,
+      totalShares=totalShares1 + totalSharesAtomVault, totalAssets=totalAssets1 + totalAssetsAtomVault,
+      protocolMultisigAssets=protocolMultisigAssets1),
+    obj=atomTemplate.format(value=value + 2, userShares=userShares2 + userSharesAtomVault, atomWalletShares=atomWalletShares2,
+      totalShares=totalShares2 + totalSharesAtomVault, totalAssets=totalAssets2 + totalAssetsAtomVault,
+      protocolMultisigAssets=protocolMultisigAssets2)), file=out)
 
 
 ## ------------ Deposit Atom data ------------
 
-print()
-print("Deposit atom data")
-
-for value in [
-    atomCost,
-    Decimal(atomCost) + Decimal(1),
-    Web3.to_wei(Decimal('1'), 'ether'),
-    Web3.to_wei(Decimal('10'), 'ether'),
-    Web3.to_wei(Decimal('100'), 'ether'),
-    Web3.to_wei(Decimal('1000'), 'ether'),
-]:
+print(file=out)
+print("Deposit atom data", file=out)
+
+for value in testValuesAtom:
   (userShares, totalShares, totalAssets, atomWalletShares, protocolMultisigAssets) = createAtom(value)
 
   for _ in range(3):
@@ -274,38 +264,24 @@ for value in [
     userShares += userSharesFromDeposit
     protocolMultisigAssets += protocolMultisigAssetsFromDeposit
 
-  print(f"useCaseAtoms.push(UseCaseAtom({{ \
-    value: {value}, \
-    userShares: {userShares}, \
-    atomWalletShares: {atomWalletShares}, \
-    totalShares: {totalShares}, \
-    totalAssets: {totalAssets}, \
-    protocolMultisigAssets: {protocolMultisigAssets} \
-  }}));".replace("  ", ''))
+  print(atomPushTemplate.format(value=value, userShares=userShares, atomWalletShares=atomWalletShares,
+    totalShares=totalShares, totalAssets=totalAssets, protocolMultisigAssets=protocolMultisigAssets), file=out)
 
 
 ## ------------ Deposit Triple data ------------
 
-print()
-print("Deposit triple data")
-
-for value in [
-    tripleCost,
-    Decimal(tripleCost) + Decimal(1),
-    Web3.to_wei(Decimal('1'), 'ether'),
-    Web3.to_wei(Decimal('10'), 'ether'),
-    Web3.to_wei(Decimal('100'), 'ether'),
-    Web3.to_wei(Decimal('1000'), 'ether'),
-]:
-  # Create 3 atoms
-  (userShares0, totalShares0, totalAssets0, atomWalletShares0, protocolMultisigAssets0) = createAtom(atomCost)
-  (userShares1, totalShares1, totalAssets1, atomWalletShares1, protocolMultisigAssets1) = createAtom(atomCost)
-  (userShares2, totalShares2, totalAssets2, atomWalletShares2, protocolMultisigAssets2) = createAtom(atomCost)
+print(file=out)
+print("Deposit triple data", file=out)
 
-  userSharesPerAtom = userShares0
-  totalSharesPerAtom = totalShares0
-  totalAssetsPerAtom = totalAssets0
-  protocolMultisigAssets = protocolMultisigAssets0 + protocolMultisigAssets1 + protocolMultisigAssets2
+# The 3 atoms are always created at atomCost, so every test value shares their results
+(atomUserShares, atomTotalShares, atomTotalAssets, atomWalletShares, atomProtocolMultisigAssets) = createAtom(atomCost)
+
+for value in testValuesTriple:
+  # Create 3 atoms
+  userSharesPerAtom = atomUserShares
+  totalSharesPerAtom = atomTotalShares
+  totalAssetsPerAtom = atomTotalAssets
+  protocolMultisigAssets = 3 * atomProtocolMultisigAssets
 
   # Create 1 triple
   (userSharesPositiveVault, totalSharesPositiveVault, totalAssetsPositiveVault, totalSharesNegativeVault,
@@ -330,54 +306,22 @@ for value in [
     totalAssetsPerAtom += totalAssetsPerAtomFromDeposit
     protocolMultisigAssets += protocolMultisigAssetsFromDeposit
 
-  print(f"useCaseTriples.push(UseCaseTriple({{ \
-    value: {value}, \
-    userShares: {userSharesPositiveVault}, \
-    totalSharesPos: {totalSharesPositiveVault}, \
-    totalAssetsPos: {totalAssetsPositiveVault}, \
-    totalSharesNeg: {totalSharesNegativeVault}, \
-    totalAssetsNeg: {totalAssetsNegativeVault}, \
-    protocolMultisigAssets: {protocolMultisigAssets}, \
-    subject:UseCaseAtom({{ \
-      value: {atomCost}, \
-      userShares: {userSharesPerAtom}, \
-      atomWalletShares: {atomWalletShares0}, \
-      totalShares: {totalSharesPerAtom}, \
-      totalAssets: {totalAssetsPerAtom}, \
-      protocolMultisigAssets: {protocolMultisigAssets0} \
-    }}), \
-    predicate:UseCaseAtom({{ \
-      value: {atomCost}, \
-      userShares: {userSharesPerAtom}, \
-      atomWalletShares: {atomWalletShares1}, \
-      totalShares: {totalSharesPerAtom}, \
-      totalAssets: {totalAssetsPerAtom}, \
-      protocolMultisigAssets: {protocolMultisigAssets1} \
-    }}), \
-    obj:UseCaseAtom({{ \
-      value: {atomCost}, \
-      userShares: {userSharesPerAtom}, \
-      atomWalletShares: {atomWalletShares2}, \
-      totalShares: {totalSharesPerAtom}, \
-      totalAssets: {totalAssetsPerAtom}, \
-      protocolMultisigAssets: {protocolMultisigAssets2} \
-    }}) \
-  }}));".replace("  ", ''))
+  # The 3 atoms end up with identical vaults
+  atom = atomTemplate.format(value=atomCost, userShares=userSharesPerAtom, atomWalletShares=atomWalletShares,
+    totalShares=totalSharesPerAtom, totalAssets=totalAssetsPerAtom, protocolMultisigAssets=atomProtocolMultisigAssets)
+
+  print(triplePushTemplate.format(value=value, userShares=userSharesPositiveVault,
+    totalSharesPos=totalSharesPositiveVault, totalAssetsPos=totalAssetsPositiveVault,
+    totalSharesNeg=totalSharesNegativeVault, totalAssetsNeg=totalAssetsNegativeVault,
+    protocolMultisigAssets=protocolMultisigAssets, subject=atom, predicate=atom, obj=atom), file=out)
 
 
 ## ------------ Redeem Atom data ------------
 
-print()
-print("Redeem atom data")
-
-for value in [
-    atomCost,
-    Decimal(atomCost) + Decimal(1),
-    Web3.to_wei(Decimal('1'), 'ether'),
-    Web3.to_wei(Decimal('10'), 'ether'),
-    Web3.to_wei(Decimal('100'), 'ether'),
-    Web3.to_wei(Decimal('1000'), 'ether'),
-]:
+print(file=out)
+print("Redeem atom data", file=out)
+
+for value in testValuesAtom:
   (userShares, totalShares, totalAssets, _, protocolMultisigAssets) = createAtom(value)
 
   for _ in range(3):
@@ -392,35 +336,18 @@ for value in [
   totalRemainingAssets = totalAssets - userAssets - protocolFeeAmount
   protocolMultisigAssets += protocolFeeAmount
 
-  print(f"useCaseRedeems.push(UseCaseRedeem({{ \
-    value: {value}, \
-    shares: {userShares}, \
-    assets: {userAssets}, \
-    totalRemainingShares: {totalRemainingShares}, \
-    totalRemainingAssets: {totalRemainingAssets}, \
-    protocolMultisigAssets: {protocolMultisigAssets} \
-  }}));".replace("  ", ''))
+  print(redeemPushTemplate.format(value=value, shares=userShares, assets=userAssets, totalRemainingShares=totalRemainingShares,
+    totalRemainingAssets=totalRemainingAssets, protocolMultisigAssets=protocolMultisigAssets), file=out)
 
 
 ## ------------ Redeem Triple data ------------
 
-print()
-print("Redeem triple data")
-
-for value in [
-    tripleCost,
-    Decimal(tripleCost) + Decimal(1),
-    Web3.to_wei(Decimal('1'), 'ether'),
-    Web3.to_wei(Decimal('10'), 'ether'),
-    Web3.to_wei(Decimal('100'), 'ether'),
-    Web3.to_wei(Decimal('1000'), 'ether'),
-]:
-  # Create 3 atoms
-  (_, _, _, _, protocolMultisigAssets0) = createAtom(atomCost)
-  (_, _, _, _, protocolMultisigAssets1) = createAtom(atomCost)
-  (_, _, _, _, protocolMultisigAssets2) = createAtom(atomCost)
+print(file=out)
+print("Redeem triple data", file=out)
 
-  protocolMultisigAssets = protocolMultisigAssets0 + protocolMultisigAssets1 + protocolMultisigAssets2
+for value in testValuesTriple:
+  # Create 3 atoms
+  protocolMultisigAssets = 3 * atomProtocolMultisigAssets
 
   # Create 1 triple
   (userShares, totalShares, totalAssets, _, _, _, _, _, protocolFeeAmount) = createTriple(value)
@@ -431,7 +358,7 @@ for value in [
     # Deposits
     (userSharesFromDeposit, totalSharesPositiveVaultFromDeposit, totalAssetsPositiveVaultFromDeposit, _, _, _, protocolFeeAmount) = \
       depositTriple(value, totalAssets, totalShares, 1, 1) # any atom totals, not used in this case
-    
+
     userShares += userSharesFromDeposit
     totalShares += totalSharesPositiveVaultFromDeposit
     totalAssets += totalAssetsPositiveVaultFromDeposit
@@ -443,11 +370,8 @@ for value in [
   totalRemainingAssets = totalAssets - userAssets - protocolFeeAmount
   protocolMultisigAssets += protocolFeeAmount
 
-  print(f"useCaseRedeems.push(UseCaseRedeem({{ \
-    value: {value}, \
-    shares: {userShares}, \
-    assets: {userAssets}, \
-    totalRemainingShares: {totalRemainingShares}, \
-    totalRemainingAssets: {totalRemainingAssets}, \
-    protocolMultisigAssets: {protocolMultisigAssets} \
-  }}));".replace("  ", ''))
+  print(redeemPushTemplate.format(value=value, shares=userShares, assets=userAssets, totalRemainingShares=totalRemainingShares,
+    totalRemainingAssets=totalRemainingAssets, protocolMultisigAssets=protocolMultisigAssets), file=out)
+
+
+sys.stdout.write(out.getvalue())
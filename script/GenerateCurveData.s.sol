@@ -86,7 +86,7 @@ contract GenerateCurveData is Script {
         for (uint256 i = 0; i < points.length; i++) {
             // Convert to ETH units for readability
             string memory point = string.concat(
-                '{"assets":', vm.toString(points[i].assets), ',"shares":', vm.toString(points[i].shares), "}"
+                '{"assets":', toEtherString(points[i].assets), ',"shares":', toEtherString(points[i].shares), "}"
             );
 
             if (i < points.length - 1) {
@@ -99,6 +99,17 @@ contract GenerateCurveData is Script {
         return string.concat(json, "]}");
     }
 
+    function toEtherString(uint256 amount) internal pure returns (string memory) {
+        // Render a wei amount as a decimal ETH number with all 18 fractional digits
+        bytes memory fraction = bytes(vm.toString(amount % 1 ether));
+        bytes memory padded = new bytes(18);
+        uint256 offset = 18 - fraction.length;
+        for (uint256 i = 0; i < 18; i++) {
+            padded[i] = i < offset ? bytes1("0") : fraction[i - offset];
+        }
+        return string.concat(vm.toString(amount / 1 ether), ".", string(padded));
+    }
+
     function toLowerCase(string memory str) internal pure returns (string memory) {
         bytes memory bStr = bytes(str);
         bytes memory bLower = new bytes(bStr.length);
@@ -1,9 +1,22 @@
 #!/usr/bin/env python3
 import json
 import os
+import re
+import subprocess
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# A line that is empty or holds only whitespace
+BLANK_LINE_RE = re.compile(r'^[^\S\n]*$', re.MULTILINE)
 
 def load_curve_data(data_path):
     """Load curve data from JSON file"""
+    if orjson is not None:
+        with open(data_path, 'rb') as f:
+            return orjson.loads(f.read())
     with open(data_path, 'r') as f:
         return json.load(f)
 
@@ -11,18 +24,19 @@ def generate_mermaid_graph(data, title):
     """Generate a mermaid line graph from curve data"""
     points = data['points']
     
-    # Extract x and y values and scale them, formatting as regular decimals
-    x_values = [f"{int(p['assets']) / 1e18:.18f}" for p in points]
-    y_values = [f"{int(p['shares']) / 1e18:.18f}" for p in points]
+    # Extract x and y values, already scaled to ETH by the forge script, formatting as regular decimals
+    point_format = ', '.join(['%.18f'] * len(points))
+    x_values = point_format % tuple(p['assets'] for p in points)
+    y_values = point_format % tuple(p['shares'] for p in points)
     
     # Start the mermaid graph
     mermaid = [
         '```mermaid',
         'xychart-beta',
         f'    title "{title}"',
-        f'    x-axis "Assets (ETH)" [{", ".join(x_values)}]',
+        f'    x-axis "Assets (ETH)" [{x_values}]',
         f'    y-axis "Shares"',
-        f'    line [{", ".join(y_values)}]',
+        f'    line [{y_values}]',
         '```\n'
     ]
     
@@ -45,28 +59,35 @@ def insert_graph_into_doc(doc_path, data_path):
     init_directive = '\n```mermaid\n%%{init: {"xychart": {"showTitle": true}} }%%\n```\n\n'
     graph = generate_mermaid_graph(data, f'{data["name"].title()} Curve')
     
-    # Find the end of the contract description (first empty line after the description)
-    lines = content.split('\n')
-    insert_pos = 0
-    for i, line in enumerate(lines):
-        if line.startswith('*'):  # Skip past the contract metadata
-            continue
-        if not line.strip():  # First empty line after metadata
-            insert_pos = i
-            break
+    # Find the end of the contract description (first empty line after the description);
+    # metadata lines start with '*' and are never blank, so this is the first blank line
+    blank_line = BLANK_LINE_RE.search(content)
+    if blank_line:
+        insert_at = blank_line.end()
+    else:
+        insert_at = content.find('\n')
+        if insert_at == -1:
+            insert_at = len(content)
     
     # Insert the initialization and graph after the description
-    lines.insert(insert_pos + 1, "\n## Curve Visualization\n")
-    lines.insert(insert_pos + 2, init_directive)
-    lines.insert(insert_pos + 3, graph)
+    section = '\n'.join(["\n## Curve Visualization\n", init_directive, graph])
     
     # Write the updated content
     with open(doc_path, 'w') as f:
-        f.write('\n'.join(lines))
+        f.write(content[:insert_at] + '\n' + section + content[insert_at:])
+
+def process_curve_file(file_info):
+    """Insert the graph for one curve into its markdown documentation"""
+    # Convert HTML path to markdown path
+    md_path = file_info['doc'].replace('/book/src/', '/src/src/').replace('.html', '.md')
+    if os.path.exists(md_path):
+        insert_graph_into_doc(md_path, file_info['data'])
+    else:
+        print(f"Markdown file not found: {md_path}")
 
 def main():
-    # Generate forge script data
-    os.system('forge script script/GenerateCurveData.s.sol --ffi')
+    # Generate forge script data, its output goes straight to the log and a failure stops the script
+    subprocess.run(['forge', 'script', 'script/GenerateCurveData.s.sol', '--ffi'], check=True)
     
     # Load the metadata file
     try:
@@ -81,12 +102,7 @@ def main():
     
     # Process each curve
     for file_info in metadata['files']:
-        # Convert HTML path to markdown path
-        md_path = file_info['doc'].replace('/book/src/', '/src/src/').replace('.html', '.md')
-        if os.path.exists(md_path):
-            insert_graph_into_doc(md_path, file_info['data'])
-        else:
-            print(f"Markdown file not found: {md_path}")
+        process_curve_file(file_info)
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
@@ -2,38 +2,106 @@
 
 import os
 import re
+import mmap
+import sys
 import json
 from typing import Dict, List, Set, Tuple
 from collections import defaultdict
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Contract JSON files from this size on are memory mapped rather than read
+MMAP_MIN_SIZE = 4096
+
+# Contract names listed in a devdoc "Inherits:" section
+INHERITS_RE = re.compile(r'\b([A-Z]\w+)\b')
+
+# Mermaid line templates, filled with % formatting
+SUBGRAPH_TEMPLATE = '\n    subgraph %s ["%s"]\n        direction LR\n'
+NODE_TEMPLATE = '%s[%s]'
+CLICK_TEMPLATE = '    click %s "%s" "%s documentation"\n'
+
+# Mermaid class definitions and category styling appended to each diagram
+CONTRACT_STYLES = """
+    %% Style definitions
+    classDef default fill:#f4f4f4,stroke:#333,stroke-width:2px,font-size:28px,font-family:Arial,rounded:true;
+    classDef root fill:#6366f1,color:#fff,stroke:#4338ca,stroke-width:4px,font-size:32px,font-weight:bold,font-family:Arial,rx:40px;
+    classDef stateVar fill:#dbeafe,stroke:#3b82f6,stroke-width:2px,color:#1e40af,font-size:28px,font-family:Arial,rounded:true;
+    classDef function fill:#e0e7ff,stroke:#818cf8,stroke-width:2px,color:#4338ca,font-size:28px,font-family:Arial,rounded:true;
+    classDef contract fill:#fef3c7,stroke:#f59e0b,stroke-width:2px,color:#b45309,font-size:28px,font-family:Arial,rounded:true;
+    classDef category fill:none,stroke:none,color:#333,font-size:28px,font-weight:bold,font-family:Arial;
+    
+    %% Apply styles
+    class root root;
+    class StateVars,CoreFunctions,Getters,Setters,PreviewFunctions,ConversionFunctions,Initialization,Uses,Inheritance category;
+"""
+
+OVERVIEW_STYLES = """
+    %% Style definitions
+    classDef default fill:#f4f4f4,stroke:#333,stroke-width:2px,font-size:24px,font-family:Arial,rounded:true,color:#000;
+    classDef root fill:#6366f1,color:#fff,stroke:#4338ca,stroke-width:4px,font-size:32px,font-weight:bold,font-family:Arial,rx:40px;
+    classDef category fill:none,stroke:none,color:#000,font-size:24px,font-weight:bold,font-family:Arial;
+    
+    %% Apply styles
+"""
 
 class ContractInfo:
+    __slots__ = (
+        "name", "conversions", "core_functions", "getters", "inits", "previews", "setters", "state_vars",
+        "inherits_from", "uses", "is_interface", "is_abstract", "source_path", "sorted_state_vars", "sorted_functions",
+    )
+
     def __init__(self, name: str):
         self.name = name
-        self.functions: Dict[str, List[str]] = defaultdict(list)  # category -> functions
-        self.state_vars: Dict[str, List[str]] = defaultdict(list)  # category -> vars
+        # Function names, one list per function category
+        self.conversions: List[str] = []
+        self.core_functions: List[str] = []
+        self.getters: List[str] = []
+        self.inits: List[str] = []
+        self.previews: List[str] = []
+        self.setters: List[str] = []
+        self.state_vars: List[Tuple[str, str]] = []  # (name, declaration) pairs
         self.inherits_from: Set[str] = set()
         self.uses: Set[str] = set()
         self.is_interface = False
         self.is_abstract = False
         self.source_path = ""
+        # Sorted views used by the diagram, filled in once parsing is done
+        self.sorted_state_vars: List[Tuple[str, str]] = []
+        self.sorted_functions: List[Tuple[str, List[str]]] = []  # (category, function names)
+
+# ContractInfo function lists keyed by the first three characters of their name prefix
+CATEGORY_BY_PREFIX = {
+    "pre": ("preview", "previews"),
+    "get": ("get", "getters"),
+    "set": ("set", "setters"),
+    "ini": ("init", "inits"),
+    "con": ("convert", "conversions"),
+}
+
+# Function category subgraphs of a contract diagram, in order, with the ContractInfo list they show
+FUNCTION_CATEGORIES = (
+    ("Conversion Functions", "conversions"),
+    ("Core Functions", "core_functions"),
+    ("Getters", "getters"),
+    ("Initialization", "inits"),
+    ("Preview Functions", "previews"),
+    ("Setters", "setters"),
+)
 
 def categorize_function(name: str) -> str:
-    """Categorize function based on its name prefix."""
-    if name.startswith("preview"):
-        return "Preview Functions"
-    elif name.startswith("get"):
-        return "Getters"
-    elif name.startswith("set"):
-        return "Setters"
-    elif name.startswith("init"):
-        return "Initialization"
-    elif name.startswith("convert"):
-        return "Conversion Functions"
-    else:
-        return "Core Functions"
+    """Categorize function based on its name prefix, returning the ContractInfo list it belongs to."""
+    match = CATEGORY_BY_PREFIX.get(name[:3])
+    if match and name.startswith(match[0]):
+        return match[1]
+    return "core_functions"
 
-def get_doc_link(contract_name: str, source_path: str, member_name: str = "") -> str:
-    """Generate documentation link for a contract or member."""
+def get_contract_url(contract_name: str, source_path: str) -> str:
+    """Generate the documentation URL of a contract page."""
     base_url = "http://localhost:3000/src/"
     
     # Get the full path and type from the source path
@@ -45,10 +113,15 @@ def get_doc_link(contract_name: str, source_path: str, member_name: str = "") ->
         type_prefix = "contract"
     
     # Use the full source path for the link
-    if member_name:
-        return f"{base_url}{source_path}/{type_prefix}.{contract_name}.html#{member_name.lower()}"
     return f"{base_url}{source_path}/{type_prefix}.{contract_name}.html"
 
+def group_in_pairs(items: List[str]) -> List[List[str]]:
+    """Group items in pairs, laid out side by side in a subgraph."""
+    # Most subgraphs hold one or two members, which form a single row as is
+    if 0 < len(items) <= 2:
+        return [items]
+    return [items[i:i + 2] for i in range(0, len(items), 2)]
+
 def get_category_from_path(path: str) -> str:
     """Get the category for a contract based on its path."""
     parts = path.split('/')
@@ -60,66 +133,87 @@ def get_category_from_path(path: str) -> str:
     # Use the first subdirectory as the category
     return parts[0].title()
 
-def parse_contract_doc(contract_path: str) -> ContractInfo:
+def load_contract_json(contract_path: str) -> dict:
+    """Load a forge inspect JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(contract_path, 'rb') as f:
+            # Large files are parsed straight from a memory map instead of being copied into a bytes object
+            if os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                    return orjson.loads(view)
+            return orjson.loads(f.read())
+    with open(contract_path, 'r') as f:
+        return json.load(f)
+
+def index_source_files(src_dir: str = "src") -> Dict[str, str]:
+    """Map each Solidity file name under src_dir to its path relative to src_dir."""
+    source_paths: Dict[str, str] = {}
+    for root, _, files in os.walk(src_dir):
+        for file in files:
+            if file.endswith(".sol"):
+                source_paths.setdefault(file, os.path.relpath(os.path.join(root, file), src_dir))
+    return source_paths
+
+def parse_contract_doc(contract_path: str, source_paths: Dict[str, str]) -> ContractInfo:
     base = os.path.basename(contract_path).replace(".json", "")
     info = ContractInfo(base)
     
-    with open(contract_path, 'r') as f:
-        data = json.load(f)
-        
-        # Parse ABI for functions
-        if "abi" in data:
-            for item in data["abi"]:
-                if item.get("type") == "function":
-                    name = item["name"]
-                    inputs = [f"{inp.get('name', '')}: {inp['type']}" for inp in item.get("inputs", [])]
-                    outputs = [f"{out.get('name', '')}: {out['type']}" for out in item.get("outputs", [])]
-                    sig = f"{name}({', '.join(inputs)})"
-                    if outputs:
-                        sig += f" → {', '.join(outputs)}"
-                    category = categorize_function(name)
-                    info.functions[category].append((name, sig))
+    data = load_contract_json(contract_path)
+    
+    # Parse ABI for functions
+    if "abi" in data:
+        for item in data["abi"]:
+            if item.get("type") == "function":
+                # Diagrams only show function names, so the signature is not built
+                name = item["name"]
+                getattr(info, categorize_function(name)).append(name)
 
-        # Parse storage layout for state variables
-        if "storageLayout" in data and "storage" in data["storageLayout"]:
-            for item in data["storageLayout"]["storage"]:
-                var_type = item["type"]
-                var_name = item["label"]
-                category = "State Variables"
-                info.state_vars[category].append((var_name, f"{var_type} {var_name}"))
+    # Parse storage layout for state variables
+    if "storageLayout" in data and "storage" in data["storageLayout"]:
+        for item in data["storageLayout"]["storage"]:
+            var_type = item["type"]
+            var_name = item["label"]
+            info.state_vars.append((var_name, f"{var_type} {var_name}"))
 
-        # Check contract type and inheritance
-        if "devdoc" in data:
-            info.is_interface = data["devdoc"].get("kind") == "interface" or base.startswith('I')
-            info.is_abstract = data["devdoc"].get("kind") == "abstract"
-            # Parse inheritance from devdoc
-            details = data["devdoc"].get("details", "")
-            if "Inherits:" in details:
-                inherits = details.split("Inherits:")[1].strip()
-                info.inherits_from.update(re.findall(r'\b([A-Z]\w+)\b', inherits))
+    # Check contract type and inheritance
+    if "devdoc" in data:
+        info.is_interface = data["devdoc"].get("kind") == "interface" or base.startswith('I')
+        info.is_abstract = data["devdoc"].get("kind") == "abstract"
+        # Parse inheritance from devdoc
+        details = data["devdoc"].get("details", "")
+        _, found, inherits = details.partition("Inherits:")
+        if found:
+            info.inherits_from.update(INHERITS_RE.findall(inherits))
 
-        # Look for the contract in src directory to determine its path
-        for root, _, files in os.walk("src"):
-            for file in files:
-                if file == f"{base}.sol":
-                    # Get the relative path from src
-                    rel_path = os.path.relpath(os.path.join(root, file), "src")
-                    info.source_path = rel_path
-                    break
-            if info.source_path:
-                break
-                
-        # If not found, default to root
-        if not info.source_path:
-            info.source_path = f"{base}.sol"
+    # Look up the contract's path relative to src, defaulting to root if it is not found
+    info.source_path = source_paths.get(f"{base}.sol", f"{base}.sol")
+
+    info.sorted_state_vars = sorted(info.state_vars)
+    info.sorted_functions = [
+        (category, sorted(getattr(info, attr))) for category, attr in FUNCTION_CATEGORIES if getattr(info, attr)
+    ]
 
     return info
 
+def append_member_subgraph(parts: List[str], node_ids: List[str], subgraph_id: str, label: str,
+                           node_prefix: str, names: List[str]) -> None:
+    """Append a subgraph of the root node holding one node per name, recording the node ids for styling."""
+    parts.append(SUBGRAPH_TEMPLATE % (subgraph_id, label))
+    # Group nodes in pairs for better layout
+    cells = []
+    for name in names:
+        node_id = node_prefix + name
+        node_ids.append(node_id)
+        cells.append(NODE_TEMPLATE % (node_id, name))
+    parts.extend(f"        {' & '.join(pair)}\n" for pair in group_in_pairs(cells))
+    parts.append("    end\n")
+    parts.append(f"    root --> {subgraph_id}\n")
+
 def generate_contract_diagram(contract: ContractInfo) -> str:
-    mermaid = f"""```mermaid
+    parts = [f"""```mermaid
 graph TB
     root(("{contract.name}"))
-"""
+"""]
     
     # Track nodes for styling
     state_var_nodes = []
@@ -128,153 +222,56 @@ graph TB
     
     # Add state variables subgraph if present
     if contract.state_vars:
-        mermaid += """
-    subgraph StateVars ["📦 State Variables"]
-        direction LR
-"""
-        # Group vars in pairs for better layout
-        pairs = []
-        current_pair = []
-        for var_name, var_sig in sorted(contract.state_vars["State Variables"]):
-            node_id = f"var_{var_name}"
-            state_var_nodes.append(node_id)
-            current_pair.append(f"{node_id}[{var_name}]")
-            if len(current_pair) == 2:
-                pairs.append(current_pair)
-                current_pair = []
-        if current_pair:
-            pairs.append(current_pair)
-            
-        for pair in pairs:
-            mermaid += f"        {' & '.join(pair)}\n"
-        mermaid += "    end\n"
-        mermaid += "    root --> StateVars\n"
+        append_member_subgraph(parts, state_var_nodes, "StateVars", "📦 State Variables", "var_",
+                               [var_name for var_name, _ in contract.sorted_state_vars])
     
     # Add functions by category
-    for category, funcs in sorted(contract.functions.items()):
-        if funcs:  # Only add category if it has functions
-            safe_category = category.replace(" ", "")
-            mermaid += f"""
-    subgraph {safe_category} ["{category}"]
-        direction LR
-"""
-            # Group functions in pairs
-            pairs = []
-            current_pair = []
-            for func_name, func_sig in sorted(funcs):
-                node_id = f"func_{func_name}"
-                function_nodes.append(node_id)
-                current_pair.append(f"{node_id}[{func_name}]")
-                if len(current_pair) == 2:
-                    pairs.append(current_pair)
-                    current_pair = []
-            if current_pair:
-                pairs.append(current_pair)
-                
-            for pair in pairs:
-                mermaid += f"        {' & '.join(pair)}\n"
-            mermaid += "    end\n"
-            mermaid += f"    root --> {safe_category}\n"
+    for category, funcs in contract.sorted_functions:
+        append_member_subgraph(parts, function_nodes, category.replace(" ", ""), category, "func_", funcs)
     
     # Add inheritance information if present
     if contract.inherits_from:
-        mermaid += """
-    subgraph Inheritance ["🔄 Inherits From"]
-        direction LR
-"""
-        # Group inherited contracts in pairs
-        pairs = []
-        current_pair = []
-        for parent in sorted(contract.inherits_from):
-            node_id = f"inherits_{parent}"
-            contract_nodes.append(node_id)
-            current_pair.append(f"{node_id}[{parent}]")
-            if len(current_pair) == 2:
-                pairs.append(current_pair)
-                current_pair = []
-        if current_pair:
-            pairs.append(current_pair)
-            
-        for pair in pairs:
-            mermaid += f"        {' & '.join(pair)}\n"
-        mermaid += "    end\n"
-        mermaid += "    root --> Inheritance\n"
+        append_member_subgraph(parts, contract_nodes, "Inheritance", "🔄 Inherits From", "inherits_",
+                               sorted(contract.inherits_from))
     
     # Add usage information if present
     if contract.uses:
-        mermaid += """
-    subgraph Uses ["🔗 Uses"]
-        direction LR
-"""
-        # Group used contracts in pairs
-        pairs = []
-        current_pair = []
-        for used in sorted(contract.uses):
-            node_id = f"uses_{used}"
-            contract_nodes.append(node_id)
-            current_pair.append(f"{node_id}[{used}]")
-            if len(current_pair) == 2:
-                pairs.append(current_pair)
-                current_pair = []
-        if current_pair:
-            pairs.append(current_pair)
-            
-        for pair in pairs:
-            mermaid += f"        {' & '.join(pair)}\n"
-        mermaid += "    end\n"
-        mermaid += "    root --> Uses\n"
+        append_member_subgraph(parts, contract_nodes, "Uses", "🔗 Uses", "uses_", sorted(contract.uses))
     
     # Add styles
-    mermaid += """
-    %% Style definitions
-    classDef default fill:#f4f4f4,stroke:#333,stroke-width:2px,font-size:28px,font-family:Arial,rounded:true;
-    classDef root fill:#6366f1,color:#fff,stroke:#4338ca,stroke-width:4px,font-size:32px,font-weight:bold,font-family:Arial,rx:40px;
-    classDef stateVar fill:#dbeafe,stroke:#3b82f6,stroke-width:2px,color:#1e40af,font-size:28px,font-family:Arial,rounded:true;
-    classDef function fill:#e0e7ff,stroke:#818cf8,stroke-width:2px,color:#4338ca,font-size:28px,font-family:Arial,rounded:true;
-    classDef contract fill:#fef3c7,stroke:#f59e0b,stroke-width:2px,color:#b45309,font-size:28px,font-family:Arial,rounded:true;
-    classDef category fill:none,stroke:none,color:#333,font-size:28px,font-weight:bold,font-family:Arial;
-    
-    %% Apply styles
-    class root root;
-    class StateVars,CoreFunctions,Getters,Setters,PreviewFunctions,ConversionFunctions,Initialization,Uses,Inheritance category;
-"""
+    parts.append(CONTRACT_STYLES)
     
     # Apply styles to nodes
     if state_var_nodes:
-        mermaid += f"    class {','.join(state_var_nodes)} stateVar;\n"
+        parts.append(f"    class {','.join(state_var_nodes)} stateVar;\n")
     if function_nodes:
-        mermaid += f"    class {','.join(function_nodes)} function;\n"
+        parts.append(f"    class {','.join(function_nodes)} function;\n")
     if contract_nodes:
-        mermaid += f"    class {','.join(contract_nodes)} contract;\n"
+        parts.append(f"    class {','.join(contract_nodes)} contract;\n")
     
     # Add click actions
-    mermaid += "\n    %% Click actions\n"
+    parts.append("\n    %% Click actions\n")
     
     # Add click for root node to link to contract documentation
-    mermaid += f'    click root "{get_doc_link(contract.name, contract.source_path)}" "{contract.name} documentation"\n'
+    contract_url = get_contract_url(contract.name, contract.source_path)
+    click_rows = [("root", contract_url, contract.name)]
     
     # Add clicks for state variables
-    for var_name, _ in contract.state_vars.get("State Variables", []):
-        node_id = f"var_{var_name}"
-        mermaid += f'    click {node_id} "{get_doc_link(contract.name, contract.source_path, var_name)}" "{var_name} documentation"\n'
+    click_rows.extend(("var_" + var_name, contract_url + "#" + var_name.lower(), var_name)
+                      for var_name, _ in contract.state_vars)
     
     # Add clicks for functions
-    for category, funcs in contract.functions.items():
-        for func_name, _ in funcs:
-            node_id = f"func_{func_name}"
-            mermaid += f'    click {node_id} "{get_doc_link(contract.name, contract.source_path, func_name)}" "{func_name} documentation"\n'
+    click_rows.extend(("func_" + func_name, contract_url + "#" + func_name.lower(), func_name)
+                      for _, funcs in contract.sorted_functions for func_name in funcs)
     
     # Add clicks for contracts
-    for parent in contract.inherits_from:
-        node_id = f"inherits_{parent}"
-        mermaid += f'    click {node_id} "{parent}.html" "{parent} documentation"\n'
+    click_rows.extend(("inherits_" + parent, parent + ".html", parent) for parent in contract.inherits_from)
+    click_rows.extend(("uses_" + used, used + ".html", used) for used in contract.uses)
     
-    for used in contract.uses:
-        node_id = f"uses_{used}"
-        mermaid += f'    click {node_id} "{used}.html" "{used} documentation"\n'
+    parts.extend(map(CLICK_TEMPLATE.__mod__, click_rows))
     
-    mermaid += "```"
-    return mermaid
+    parts.append("```")
+    return ''.join(parts)
 
 def generate_overview_diagram(contracts: Dict[str, ContractInfo]) -> str:
     # Group contracts by their categories
@@ -285,14 +282,14 @@ def generate_overview_diagram(contracts: Dict[str, ContractInfo]) -> str:
         categorized_contracts[category].append((name, info))
     
     # Start the diagram
-    mermaid = """```mermaid
+    parts = ["""```mermaid
 graph TB
-"""
+"""]
     
     # Add root nodes for each category that has contracts
     for category in categorized_contracts.keys():
         safe_category = category.replace(" ", "")
-        mermaid += f'    {safe_category}(("{category}"))\n'
+        parts.append(f'    {safe_category}(("{category}"))\n')
     
     # Add subgraphs for each category
     for category, contract_list in categorized_contracts.items():
@@ -300,85 +297,83 @@ graph TB
             continue
             
         safe_category = category.replace(" ", "")
-        mermaid += f"""
-    subgraph {safe_category}List ["{category}"]
-        direction LR
-"""
+        parts.append(SUBGRAPH_TEMPLATE % (safe_category + "List", category))
         # Group contracts in pairs for better layout
-        pairs = []
-        current_pair = []
-        for name, _ in sorted(contract_list):
-            current_pair.append(name)
-            if len(current_pair) == 2:
-                pairs.append(current_pair)
-                current_pair = []
-        if current_pair:
-            pairs.append(current_pair)
-            
-        for pair in pairs:
-            mermaid += f"        {' & '.join(pair)}\n"
-        mermaid += "    end\n"
-        mermaid += f"    {safe_category} --> {safe_category}List\n"
+        names = sorted(name for name, _ in contract_list)
+        parts.extend(f"        {' & '.join(pair)}\n" for pair in group_in_pairs(names))
+        parts.append("    end\n")
+        parts.append(f"    {safe_category} --> {safe_category}List\n")
     
     # Add styles
-    mermaid += """
-    %% Style definitions
-    classDef default fill:#f4f4f4,stroke:#333,stroke-width:2px,font-size:24px,font-family:Arial,rounded:true,color:#000;
-    classDef root fill:#6366f1,color:#fff,stroke:#4338ca,stroke-width:4px,font-size:32px,font-weight:bold,font-family:Arial,rx:40px;
-    classDef category fill:none,stroke:none,color:#000,font-size:24px,font-weight:bold,font-family:Arial;
-    
-    %% Apply styles
-"""
+    parts.append(OVERVIEW_STYLES)
     # Add root styles
     root_nodes = [cat.replace(" ", "") for cat in categorized_contracts.keys()]
     if root_nodes:
-        mermaid += f"    class {','.join(root_nodes)} root;\n"
+        parts.append(f"    class {','.join(root_nodes)} root;\n")
     
     # Add category styles
     category_nodes = [f"{cat.replace(' ', '')}List" for cat in categorized_contracts.keys()]
     if category_nodes:
-        mermaid += f"    class {','.join(category_nodes)} category;\n"
+        parts.append(f"    class {','.join(category_nodes)} category;\n")
     
     # Add click actions
-    mermaid += "\n    %% Click actions\n"
+    parts.append("\n    %% Click actions\n")
     
-    # Add clicks for all contracts
-    for category, contract_list in categorized_contracts.items():
-        for name, info in contract_list:
-            # Core contracts link to architecture diagrams, others link to their documentation
-            if category == "Core":
-                mermaid += f'    click {name} "{name}.html" "{name} documentation"\n'
-            else:
-                mermaid += f'    click {name} "{get_doc_link(name, info.source_path)}" "{name} documentation"\n'
-    
-    mermaid += "```"
-    return mermaid
+    # Add clicks for all contracts, core contracts link to architecture diagrams, others link to their documentation
+    parts.extend(CLICK_TEMPLATE % (name, name + ".html" if category == "Core" else get_contract_url(name, info.source_path), name)
+                 for category, contract_list in categorized_contracts.items() for name, info in contract_list)
+    
+    parts.append("```")
+    return ''.join(parts)
+
+def write_if_changed(path: Path, content: str) -> None:
+    """Write content to path unless the file already holds exactly that content."""
+    data = content.encode()
+    try:
+        if path.read_bytes() == data:
+            return
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+
+def write_contract_page(name: str, contract: ContractInfo) -> None:
+    """Generate a contract's diagram and write its architecture page."""
+    diagram = generate_contract_diagram(contract)
+    write_if_changed(
+        Path(f"docs/src/architecture/{name}.md"),
+        f"# {name}\n\n"
+        f"Detailed view of the {name} contract and its members. Click on any member to view its documentation.\n\n"
+        f"{diagram}"
+    )
 
 def main():
     # Create architecture directory if it doesn't exist
     os.makedirs("docs/src/architecture", exist_ok=True)
     
     # Parse all contract information
+    with os.scandir("docs/contracts") as entries:
+        paths = [entry.path for entry in entries if entry.name.endswith(".json") and entry.is_file()]
+    source_paths = index_source_files()
     contracts: Dict[str, ContractInfo] = {}
-    for filename in os.listdir("docs/contracts"):
-        if filename.endswith(".json"):
-            contract_info = parse_contract_doc(f"docs/contracts/{filename}")
-            contracts[contract_info.name] = contract_info
+    for path in paths:
+        contract_info = parse_contract_doc(path, source_paths)
+        # Contract and parent names repeat across contracts, intern them as they are collected so they share one object
+        contract_info.name = sys.intern(contract_info.name)
+        contract_info.inherits_from = set(map(sys.intern, contract_info.inherits_from))
+        contracts[contract_info.name] = contract_info
     
     # Generate and save overview diagram
     overview = generate_overview_diagram(contracts)
-    with open("docs/src/architecture/overview.md", "w") as f:
-        f.write("# Contract Architecture\n\n")
-        f.write("This document provides an overview of the core contracts and their relationships. Click on any contract to view its detailed documentation.\n\n")
-        f.write(overview)
+    write_if_changed(
+        Path("docs/src/architecture/overview.md"),
+        "# Contract Architecture\n\n"
+        "This document provides an overview of the core contracts and their relationships. Click on any contract to view its detailed documentation.\n\n"
+        f"{overview}"
+    )
     
     # Generate individual contract pages
     for name, contract in contracts.items():
-        diagram = generate_contract_diagram(contract)
-        with open(f"docs/src/architecture/{name}.md", "w") as f:
-            f.write(f"# {name}\n\n")
-            f.write(f"Detailed view of the {name} contract and its members. Click on any member to view its documentation.\n\n")
-            f.write(diagram)
+        write_contract_page(name, contract)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
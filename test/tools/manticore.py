@@ -2,8 +2,13 @@ import os
 import subprocess
 import sys
 import json
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from manticore.ethereum import ManticoreEVM
+from manticore.core.manticore import MProcessingType
 from manticore.core.smtlib import Operators
+from manticore.core.plugin import Plugin
+from manticore.utils import config
 
 # Ensure Manticore is installed
 def install_manticore():
@@ -15,44 +20,158 @@ def install_manticore():
 
 install_manticore()
 
-# Initialize Manticore EVM
-m = ManticoreEVM()
+# Bound the time and memory the SMT solver may spend on a single query
+smt_config = config.get_group('smt')
+smt_config.timeout = 60
+smt_config.memory = 4096
 
-# User account
-user_account = m.create_account(balance=1000)
+# States whose path condition grows past this many constraints are abandoned
+MAX_PATH_CONSTRAINTS = 64
 
-# Load the compiled contract
-contract_path = 'out/EthMultiVault/EthMultiVault.json'
-if not os.path.isfile(contract_path):
-    print(f"Contract file not found at {contract_path}")
-    sys.exit(1)
+# State context flag marking states abandoned by PathConstraintBudget, which still end up in terminated_states
+BUDGET_EXCEEDED = 'path_constraint_budget_exceeded'
 
-with open(contract_path) as f:
-    contract_json = json.load(f)
-    bytecode = contract_json['bytecode']['object']
+class PathConstraintBudget(Plugin):
+    """Abandon states once their path condition exceeds MAX_PATH_CONSTRAINTS at a branch."""
 
-# Create contract
-contract_account = m.create_contract(owner=user_account, balance=0, init=bytecode)
+    def will_evm_execute_instruction_callback(self, state, instruction, arguments):
+        if instruction.semantics == 'JUMPI' and len(state.constraints.constraints) > MAX_PATH_CONSTRAINTS:
+            state.context[BUDGET_EXCEEDED] = True
+            state.abandon()
 
-# Define symbolic values
-symbolic_value = m.make_symbolic_value()
-symbolic_data = m.make_symbolic_buffer(320)
+# Functions explored at the same time, each one a single-process Manticore instance with its own solver
+EXPLORE_WORKERS = 2
 
-# Transaction sending
-m.transaction(caller=user_account, address=contract_account, data=symbolic_data, value=symbolic_value)
+# Directory holding one Manticore workspace per explored function
+WORKSPACES_DIR = 'mcore'
 
-# Explore all states
-for state in m.running_states:
-    world = state.platform
-    contract_balance = world.get_balance(contract_account.address)
+# Symbolic data bytes given to each dynamic argument (bytes, string or array), after its length word
+DYNAMIC_ARG_BYTES = 64
+
+def abi_type(param):
+    """Canonical ABI type of a parameter, expanding tuple components."""
+    if param['type'].startswith('tuple'):
+        components = ','.join(abi_type(component) for component in param['components'])
+        return f"({components}){param['type'][len('tuple'):]}"
+    return param['type']
+
+def array_element(param):
+    """Parameter for one element of an array parameter."""
+    return {**param, 'type': param['type'][:param['type'].rindex('[')]}
+
+def is_dynamic(param):
+    """Whether a parameter is ABI encoded out of line, behind an offset word."""
+    if param['type'] in ('bytes', 'string') or param['type'].endswith('[]'):
+        return True
+    if param['type'].endswith(']'):
+        # Fixed size arrays are dynamic exactly when their elements are
+        return is_dynamic(array_element(param))
+    return param['type'].startswith('tuple') and any(is_dynamic(component) for component in param['components'])
+
+def arg_bytes(param):
+    """Calldata bytes to make symbolic for one argument."""
+    if is_dynamic(param):
+        # Offset word in the head, then a length word and the data in the tail
+        return 32 + 32 + DYNAMIC_ARG_BYTES
+    if param['type'].endswith(']'):
+        # Fixed size array of static elements, encoded in place element by element
+        length = int(param['type'][param['type'].rindex('[') + 1:-1])
+        return length * arg_bytes(array_element(param))
+    if param['type'].startswith('tuple'):
+        return sum(arg_bytes(component) for component in param['components'])
+    return 32
+
+def explore(transaction, bytecode):
+    """Explore one function in its own Manticore instance, with a concrete selector and symbolic arguments."""
+    signature, selector, size, payable = transaction
+    report = [f"== {signature}"]
+
+    # Run this instance in a single process, the pool already runs EXPLORE_WORKERS of them side by side
+    core_config = config.get_group('core')
+    core_config.mprocessing = MProcessingType.single
+    core_config.procs = 1
+
+    # Name the workspace after the function and its unique selector so its test cases can be told apart, starting it fresh
+    workspace = os.path.join(WORKSPACES_DIR, f"{signature.partition('(')[0]}_{selector.hex()}")
+    shutil.rmtree(workspace, ignore_errors=True)
+
+    m = ManticoreEVM(workspace_url=workspace)
+    m.register_plugin(PathConstraintBudget())
+
+    # User account
+    user_account = m.create_account(balance=1000)
+
+    # Create contract
+    contract_account = m.create_contract(owner=user_account, balance=0, init=bytecode)
+
+    # Only the arguments are symbolic, so the dispatcher resolves to this function on every path
+    data = selector + m.make_symbolic_buffer(size) if size else selector
+
+    # Non-payable functions revert on any value, payable ones get a symbolic value bounded to keep the search small
+    if payable:
+        value = m.make_symbolic_value()
+        m.constrain(Operators.ULT(value, 2**64))
+    else:
+        value = 0
+
+    # Transaction sending
+    m.transaction(caller=user_account, address=contract_account, data=data, value=value)
+
+    # Explore all states
+    for state in m.running_states:
+        world = state.platform
+        # Report one concrete balance instead of the symbolic expression
+        contract_balance = state.solve_one(world.get_balance(contract_account.address))
+        report.append(f"Contract balance: {contract_balance}")
     m.terminate()
-    print(f"Contract balance: {contract_balance}")
 
-# Analyze issues
-for state in m.terminated_states:
-    for address, account in state.platform.items():
-        if account.storage:
-            for k, v in account.storage.items():
-                print(f"Address: {address}, Key: {k}, Value: {v}")
+    # Analyze issues, skipping partial paths cut off by the constraint budget
+    abandoned = 0
+    for state in m.terminated_states:
+        if state.context.get(BUDGET_EXCEEDED):
+            abandoned += 1
+            continue
+
+        for address, account in state.platform.items():
+            if account.storage:
+                for k, v in account.storage.items():
+                    report.append(f"Address: {address}, Key: {k}, Value: {v}")
+
+        m.generate_testcase(state, name="test_case")
+
+    if abandoned:
+        report.append(f"Skipped {abandoned} states abandoned by the path constraint budget")
+
+    return "\n".join(report)
+
+if __name__ == "__main__":
+    # Load the compiled contract
+    contract_path = 'out/EthMultiVault/EthMultiVault.json'
+    if not os.path.isfile(contract_path):
+        print(f"Contract file not found at {contract_path}")
+        sys.exit(1)
+
+    with open(contract_path) as f:
+        contract_json = json.load(f)
+        bytecode = contract_json['bytecode']['object']
+
+    # One transaction per ABI function: (signature, selector, symbolic argument bytes, payable)
+    transactions = []
+    for item in contract_json['abi']:
+        if item['type'] != 'function':
+            continue
+        signature = f"{item['name']}({','.join(abi_type(param) for param in item['inputs'])})"
+        selector = bytes.fromhex(contract_json['methodIdentifiers'][signature])
+        size = sum(arg_bytes(param) for param in item['inputs'])
+        transactions.append((signature, selector, size, item['stateMutability'] == 'payable'))
 
-    m.generate_testcase(state, name="test_case")
+    # Each function gets an independent Manticore instance, so they are explored in parallel
+    os.makedirs(WORKSPACES_DIR, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=EXPLORE_WORKERS) as executor:
+        futures = [executor.submit(explore, transaction, bytecode) for transaction in transactions]
+        # A failing function is reported on its own without dropping the reports of the others
+        for (signature, _, _, _), future in zip(transactions, futures):
+            try:
+                print(future.result())
+            except Exception as e:
+                print(f"== {signature}\nExploration failed: {e!r}")